@@ -2,24 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
 import platform
+import shutil
 import stat
-from io import BytesIO
+import subprocess
+from functools import cache
 from pathlib import Path
 from typing import Any
-from zipfile import ZipFile
 
 import httpx
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+from packaging.tags import Tag
 from packaging.tags import sys_tags
 
 REPO_ROOT = Path(__file__).parent
 
-ODIFF_VERSION = (REPO_ROOT / ".odiff-version").read_text().strip()
 ODIFF_BIN = REPO_ROOT / "odiff_py/bin/odiff.exe"
 ODIFF_LIC = REPO_ROOT / "odiff_py/bin/LICENSE-odiff"
 
+ODIFF_BIN_SHA = ODIFF_BIN.with_suffix(".sha256")
+
+# The tag specific endpoint makes paginating the releases listing (?per_page=N) unnecessary,
+# the payload is always exactly one release.
+RELEASE_TAG_URL = "https://api.github.com/repos/dmtrKovalenko/odiff/releases/tags/{tag_name}"
+CACHE_DIR = Path.home() / ".cache/odiff_py"
+BIN_CACHE_DIR = CACHE_DIR / "bin"
+
+# platform.processor() can shell out to ``uname -p`` and neither value changes within a process,
+# so both are cached at import.
+_SYSTEM = platform.system().lower()
+_PROCESSOR = platform.processor()
+
 EXTRA_HEADERS = {}
 # Needed for CI rate limits
 gh_token = os.getenv("GH_TOKEN")
@@ -27,18 +49,102 @@ if gh_token is not None:
     EXTRA_HEADERS["Authorization"] = f"Bearer {gh_token}"
 
 
-def get_release_assets(tag_name: str = ODIFF_VERSION) -> tuple[list[dict[str, Any]], str]:
+_SYS_TAGS: list[Tag] | None = None
+
+
+@cache
+def odiff_version() -> str:
+    """Read the pinned odiff version from ``.odiff-version`` once and cache it.
+
+    Returns
+    -------
+    str
+    """
+    return (REPO_ROOT / ".odiff-version").read_text().strip()
+
+
+def _sys_tags() -> list[Tag]:
+    """Get the memoized list of tags supported by the current interpreter.
+
+    Each ``sys_tags()`` call regenerates the full tag list (thousands of entries on CPython), so
+    it is materialized once per process.
+
+    Returns
+    -------
+    list[Tag]
+    """
+    global _SYS_TAGS
+    if _SYS_TAGS is None:
+        _SYS_TAGS = list(sys_tags())
+    return _SYS_TAGS
+
+
+def _client() -> httpx.Client:
+    """Create an ``httpx.Client`` so all requests reuse a single connection.
+
+    Returns
+    -------
+    httpx.Client
+    """
+    return httpx.Client(headers=EXTRA_HEADERS, follow_redirects=True)
+
+
+def _read_release_cache(cache_path: Path) -> dict[str, Any] | None:
+    """Read the cached release API payload if present and valid.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Path to the cache file.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        Cached release API payload or None on cache miss.
+    """
+    if cache_path.is_file() is False:
+        return None
+    try:
+        return _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_release_cache(cache_path: Path, release: dict[str, Any]) -> None:
+    """Atomically write the release API payload to the cache.
+
+    Parameters
+    ----------
+    cache_path : Path
+        Path to the cache file.
+    release : dict[str, Any]
+        Release API payload to cache.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(release))
+    tmp_path.replace(cache_path)
+
+
+def get_release_assets(
+    tag_name: str | None = None, *, client: httpx.Client
+) -> list[dict[str, Any]]:
     """Get list of assets for the release with tag ``tag_name``.
 
+    Since release tags are pinned and immutable, the API payload is cached on disk keyed by tag,
+    so repeated builds don't re-hit the API (and its rate limit) at all.
+
     Parameters
     ----------
-    tag_name : str
-        Release tag. Defaults to ODIFF_VERSION
+    tag_name : str | None
+        Release tag, with None meaning the pinned ``.odiff-version``. Defaults to None
+    client : httpx.Client
+        Client used to talk to the github API.
 
     Returns
     -------
-    tuple[list[dict[str, Any]], str]
-        Assets of the release and zipball url.
+    list[dict[str, Any]]
+        Assets of the release.
 
     Raises
     ------
@@ -47,79 +153,266 @@ def get_release_assets(tag_name: str = ODIFF_VERSION) -> tuple[list[dict[str, An
     ValueError
         If response has an unexpected shape.
     """
-    resp = httpx.get(
-        "https://api.github.com/repos/dmtrKovalenko/odiff/releases", headers=EXTRA_HEADERS
-    )
+    if tag_name is None:
+        tag_name = odiff_version()
+    cache_path = CACHE_DIR / f"releases-{tag_name}.json"
+    cached = _read_release_cache(cache_path)
+    # Release tags are immutable, so a cached payload never needs revalidation; the tag check
+    # also invalidates cache files written in an older format.
+    if cached is not None and cached.get("tag_name", None) == tag_name:
+        return cached["assets"]
+
+    # The tag specific endpoint returns just the one release instead of a page of 30.
+    resp = client.get(RELEASE_TAG_URL.format(tag_name=tag_name))
     if resp.status_code != 200:
         msg = f"Bad API response: {resp}"
         raise ValueError(msg)
-    for release in resp.json():
-        if release.get("tag_name", None) == tag_name:
-            return release["assets"], release["zipball_url"]
-    msg = "API response has unexpected shape."
-    raise ValueError(msg)
+    release = _json_loads(resp.content)
+    if release.get("tag_name", None) != tag_name:
+        msg = "API response has unexpected shape."
+        raise ValueError(msg)
+    _write_release_cache(cache_path, release)
+    return release["assets"]
 
 
-def get_odiff_bin_download_url(tag_name: str = ODIFF_VERSION) -> tuple[str, str]:
-    """Get download url for the system form the release page json payload.
+def _sha256(path: Path) -> str:
+    """Compute the sha256 hex digest of the file at ``path``.
 
     Parameters
     ----------
+    path : Path
+        Path of the file to hash.
+
+    Returns
+    -------
+    str
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _downloaded_bin_tag() -> str | None:
+    """Read the release tag of the present odiff binary from its sidecar file.
+
+    Returns
+    -------
+    str | None
+        The tag or None if there is no sidecar (e.g. for a locally compiled binary).
+    """
+    if ODIFF_BIN_SHA.is_file() is False:
+        return None
+    parts = ODIFF_BIN_SHA.read_text().split()
+    return parts[0] if parts else None
+
+
+def _install_cached_bin(cache_entry: Path, tag_name: str) -> bool:
+    """Install the odiff binary from the cross-environment cache if present and intact.
+
+    Parameters
+    ----------
+    cache_entry : Path
+        Path of the cached binary.
     tag_name : str
-        Release tag. Defaults to ODIFF_VERSION
+        Release tag the cached binary belongs to.
+
+    Returns
+    -------
+    bool
+        Whether the cached binary was installed.
+    """
+    sha_file = cache_entry.with_suffix(".sha256")
+    if cache_entry.is_file() is False or sha_file.is_file() is False:
+        return False
+    sha = _sha256(cache_entry)
+    if sha != sha_file.read_text().strip():
+        return False
+    ODIFF_BIN.parent.mkdir(parents=True, exist_ok=True)
+    ODIFF_BIN.unlink(missing_ok=True)
+    try:
+        os.link(cache_entry, ODIFF_BIN)
+    except OSError:
+        shutil.copy2(cache_entry, ODIFF_BIN)
+    st = ODIFF_BIN.stat()
+    ODIFF_BIN.chmod(st.st_mode | stat.S_IEXEC)
+    ODIFF_BIN_SHA.write_text(f"{tag_name} {sha}\n")
+    return True
+
+
+def _store_bin_in_cache(cache_entry: Path, sha: str) -> None:
+    """Hardlink (or copy) the downloaded binary into the cross-environment cache.
+
+    Parameters
+    ----------
+    cache_entry : Path
+        Path of the cached binary.
+    sha : str
+        Sha256 hex digest of the downloaded binary.
+    """
+    BIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_entry.with_suffix(".sha256").write_text(f"{sha}\n")
+    cache_entry.unlink(missing_ok=True)
+    try:
+        os.link(ODIFF_BIN, cache_entry)
+    except OSError:
+        shutil.copy2(ODIFF_BIN, cache_entry)
+
+
+_ASSET_BY_PLATFORM = {
+    ("linux", "x64"): "odiff-linux-x64.exe",
+    ("windows", "x64"): "odiff-windows-x64.exe",
+    ("darwin", "arm"): "odiff-macos-arm64.exe",
+    ("darwin", "i386"): "odiff-macos-x64.exe",
+}
+
+
+def _arch_key() -> str:
+    """Get the architecture part of the ``_ASSET_BY_PLATFORM`` lookup key.
+
+    Returns
+    -------
+    str
+    """
+    if _SYSTEM == "darwin":
+        return "arm" if _PROCESSOR.startswith("arm") else _PROCESSOR
+    return "x64"
+
+
+def _asset_name() -> str | None:
+    """Get the name of the odiff release asset for the current platform.
+
+    Returns
+    -------
+    str | None
+        Asset name or None if there is no asset for the current platform.
+    """
+    return _ASSET_BY_PLATFORM.get((_SYSTEM, _arch_key()))
+
+
+def get_odiff_bin_download_url(tag_name: str | None = None, *, client: httpx.Client) -> str:
+    """Get download url for the system from the predictable release asset url.
+
+    Since the asset urls of a tagged release have a fixed shape, they are synthesized directly
+    which skips the API round-trip (and rate limit) entirely. The API based resolution only runs
+    as fallback if the synthesized url doesn't exist.
+
+    Parameters
+    ----------
+    tag_name : str | None
+        Release tag, with None meaning the pinned ``.odiff-version``. Defaults to None
+    client : httpx.Client
+        Client used to talk to the github API.
 
     Returns
     -------
-    tuple[str, str]
-        Download url of the release asset for the current platform and zipball url.
+    str
+        Download url of the release asset for the current platform.
 
     Raises
     ------
     ValueError
         If no version for the platform could be found.
     """
-    system = platform.system().lower()
-    processor = platform.processor()
+    if tag_name is None:
+        tag_name = odiff_version()
+    asset_name = _asset_name()
+    if asset_name is None:
+        msg = f"Couldn't find odiff binary for your system:\n\tsystem={_SYSTEM!r}\n\t{_PROCESSOR}"
+        raise ValueError(msg)
 
-    assets, zipball_url = get_release_assets(tag_name)
+    binary_url = (
+        f"https://github.com/dmtrKovalenko/odiff/releases/download/{tag_name}/{asset_name}"
+    )
+    if client.head(binary_url).status_code == 200:
+        return binary_url
+
+    assets = get_release_assets(tag_name, client=client)
     for asset in assets:
-        if (
-            (system == "linux" and asset["name"] == "odiff-linux-x64.exe")
-            or (system == "windows" and asset["name"] == "odiff-windows-x64.exe")
-            or (
-                system == "darwin"
-                and (
-                    (processor.startswith("arm") and asset["name"] == "odiff-macos-arm64.exe")
-                    or (processor == "i386" and asset["name"] == "odiff-macos-x64.exe")
-                )
-            )
-        ):
-            return asset["browser_download_url"], zipball_url
-    msg = f"Couldn't find odiff binary for your system:\n\t{system=}\n\t{processor}"
+        if asset["name"] == asset_name:
+            return asset["browser_download_url"]
+    msg = f"Couldn't find odiff binary for your system:\n\tsystem={_SYSTEM!r}\n\t{_PROCESSOR}"
     raise ValueError(msg)
 
 
-def download_odiff_bin(tag_name: str = ODIFF_VERSION) -> None:
+def _async_client() -> httpx.AsyncClient:
+    """Create an ``httpx.AsyncClient`` for concurrent downloads.
+
+    Returns
+    -------
+    httpx.AsyncClient
+    """
+    return httpx.AsyncClient(headers=EXTRA_HEADERS, follow_redirects=True)
+
+
+async def _stream_download(client: httpx.AsyncClient, url: str, dest: Path) -> None:
+    """Stream a download to ``dest`` in chunks instead of buffering the full body in RAM.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient
+        Client used for the download.
+    url : str
+        Url to download.
+    dest : Path
+        Path to write the downloaded data to.
+    """
+    async with client.stream("GET", url) as resp:
+        with dest.open("wb") as f:
+            async for chunk in resp.aiter_bytes(chunk_size=1 << 16):
+                f.write(chunk)
+
+
+async def _download_release_files(binary_url: str, license_url: str) -> None:
+    """Download the odiff binary and license file concurrently.
+
+    Parameters
+    ----------
+    binary_url : str
+        Download url of the odiff binary.
+    license_url : str
+        Download url of the odiff license file.
+    """
+    async with _async_client() as client:
+        await asyncio.gather(
+            _stream_download(client, binary_url, ODIFF_BIN),
+            _stream_download(client, license_url, ODIFF_LIC),
+        )
+
+
+def download_odiff_bin(tag_name: str | None = None) -> None:
     """Download odiff binary for the system from the github release page.
 
     Parameters
     ----------
-    tag_name : str
-        Release tag. Defaults to ODIFF_VERSION
+    tag_name : str | None
+        Release tag, with None meaning the pinned ``.odiff-version``. Defaults to None
     """
-    if ODIFF_BIN.is_file() is True:
+    if tag_name is None:
+        tag_name = odiff_version()
+    # A binary without sidecar (e.g. compiled locally in CI) is always kept; a downloaded one is
+    # only kept while it still matches the pinned tag.
+    if ODIFF_BIN.is_file() is True and _downloaded_bin_tag() in (None, tag_name):
+        return
+    asset_name = _asset_name()
+    cache_entry = BIN_CACHE_DIR / f"{tag_name}-{asset_name}" if asset_name is not None else None
+    if cache_entry is not None and _install_cached_bin(cache_entry, tag_name) is True:
         return
     print("Downloading odiff binary...")  # noqa: T201
     ODIFF_BIN.parent.mkdir(parents=True, exist_ok=True)
-    binary_url, zipball_url = get_odiff_bin_download_url(tag_name)
-    binary_resp = httpx.get(binary_url, follow_redirects=True, headers=EXTRA_HEADERS)
-    ODIFF_BIN.write_bytes(binary_resp.content)
+    with _client() as client:
+        binary_url = get_odiff_bin_download_url(tag_name, client=client)
+    # Fetching LICENSE straight from the repo saves downloading and unpacking the whole source
+    # zipball just for that one file.
+    license_url = f"https://raw.githubusercontent.com/dmtrKovalenko/odiff/{tag_name}/LICENSE"
+    asyncio.run(_download_release_files(binary_url, license_url))
     st = ODIFF_BIN.stat()
     ODIFF_BIN.chmod(st.st_mode | stat.S_IEXEC)
-    zipball_resp = httpx.get(zipball_url, follow_redirects=True, headers=EXTRA_HEADERS)
-    with ZipFile(BytesIO(zipball_resp.content)) as zipball:
-        base_dir = zipball.namelist()[0]
-        ODIFF_LIC.write_bytes(zipball.read(f"{base_dir}LICENSE"))
+    # Strip debug symbols so they don't end up in every wheel; macOS binaries are codesigned
+    # and stripping would invalidate the signature.
+    if _SYSTEM == "linux" and shutil.which("strip") is not None:
+        subprocess.run(["strip", "-s", os.fspath(ODIFF_BIN)], check=False)
+    sha = _sha256(ODIFF_BIN)
+    ODIFF_BIN_SHA.write_text(f"{tag_name} {sha}\n")
+    if cache_entry is not None:
+        _store_bin_in_cache(cache_entry, sha)
 
 
 class CustomBuildHook(BuildHookInterface):
@@ -127,10 +420,11 @@ class CustomBuildHook(BuildHookInterface):
 
     def initialize(self, _version: str, build_data: dict[str, Any]) -> None:  # noqa: DOC
         """Download odiff binary and update build data."""
-        if any("musllinux" in t.platform for t in sys_tags()) and ODIFF_BIN.is_file() is False:
+        tags = _sys_tags()
+        if ODIFF_BIN.is_file() is False and any("musllinux" in t.platform for t in tags):
             msg = "The upstream odiff project does currently not support 'musllinux'."
             raise ValueError(msg)
-        tag = next(iter(t for t in sys_tags()))
+        tag = tags[0]
         download_odiff_bin()
 
         build_data["force_include"][ODIFF_BIN.as_posix()] = ODIFF_BIN.relative_to(
@@ -145,6 +439,7 @@ class CustomBuildHook(BuildHookInterface):
     def clean(self, _versions: list[str]) -> None:  # noqa: DOC
         """Clean up after building the wheel."""
         ODIFF_BIN.unlink(missing_ok=True)
+        ODIFF_BIN_SHA.unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import base64
-import platform
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from shlex import quote
-from tempfile import TemporaryDirectory
+from tempfile import mkstemp
 from typing import TYPE_CHECKING
 
 from apngasm_python.apngasm import APNGAsmBinder
@@ -16,19 +17,35 @@ from PIL import Image
 
 from odiff_py import ODIFF_EXE
 
+# Precomputed once at import so each ``run_odiff`` call skips the Path -> str conversion.
+_ODIFF_EXE_STR = os.fspath(ODIFF_EXE)
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
-    from collections.abc import Sequence
+
+    import numpy as np
+
+    from odiff_py.wrapper import IgnoreArea
 
     try:
         from typing import Self  # type:ignore[attr-defined]
     except ImportError:
         from typing_extensions import Self
 
-# Image manipulation tool like transparency background style (e.g. photoshop)
-# Taken from https://stackoverflow.com/a/47061022/3990615
-CHECKER_TRANSPARENCY_CSS = " ".join(
+
+@cache
+def _checker_transparency_css() -> str:
+    """Build image manipulation tool like transparency background style (e.g. photoshop).
+
+    Taken from https://stackoverflow.com/a/47061022/3990615
+    Lazily built and cached so importing the module doesn't pay for it.
+
+    Returns
+    -------
+    str
     """
+    return " ".join(
+        """
 background: -webkit-linear-gradient(45deg, rgba(0, 0, 0, 0.0980392) 25%, transparent 25%, transparent 75%, rgba(0, 0, 0, 0.0980392) 75%, rgba(0, 0, 0, 0.0980392) 0), -webkit-linear-gradient(45deg, rgba(0, 0, 0, 0.0980392) 25%, transparent 25%, transparent 75%, rgba(0, 0, 0, 0.0980392) 75%, rgba(0, 0, 0, 0.0980392) 0), white;
 background: -moz-linear-gradient(45deg, rgba(0, 0, 0, 0.0980392) 25%, transparent 25%, transparent 75%, rgba(0, 0, 0, 0.0980392) 75%, rgba(0, 0, 0, 0.0980392) 0), -moz-linear-gradient(45deg, rgba(0, 0, 0, 0.0980392) 25%, transparent 25%, transparent 75%, rgba(0, 0, 0, 0.0980392) 75%, rgba(0, 0, 0, 0.0980392) 0), white;
 background: linear-gradient(45deg, rgba(0, 0, 0, 0.0980392) 25%, transparent 25%, transparent 75%, rgba(0, 0, 0, 0.0980392) 75%, rgba(0, 0, 0, 0.0980392) 0), linear-gradient(45deg, rgba(0, 0, 0, 0.0980392) 25%, transparent 25%, transparent 75%, rgba(0, 0, 0, 0.0980392) 75%, rgba(0, 0, 0, 0.0980392) 0), white;
@@ -52,7 +69,27 @@ transition: none;
 -webkit-transform: scaleX(1) scaleY(1) scaleZ(1);
 transform: scaleX(1) scaleY(1) scaleZ(1);
 """.splitlines()  # noqa: E501
-)
+    )
+
+
+@cache
+def _img_prefix(*, use_checker_transparency: bool) -> str:
+    """Build the constant ``<img>`` tag prefix used in ``APNG.__str__``.
+
+    Parameters
+    ----------
+    use_checker_transparency : bool
+        Whether or not to use transparency background style.
+
+    Returns
+    -------
+    str
+    """
+    return (
+        '<img style="border: 1px solid; '
+        f'{_checker_transparency_css() if use_checker_transparency is True else ""}" '
+        'src="data:image/apng;base64,'
+    )
 
 
 def run_odiff(*args: str, capture_output: bool = True) -> tuple[int, str, str]:
@@ -71,11 +108,177 @@ def run_odiff(*args: str, capture_output: bool = True) -> tuple[int, str, str]:
     tuple[int, str, str]
         Return code of running odiff and stdout.
     """
-    cmd: str | Sequence[str] = (quote(ODIFF_EXE.as_posix()), *args)
-    if platform.system().lower() == "windows":
-        cmd = " ".join(cmd)
-    result = subprocess.run(cmd, capture_output=capture_output, text=True)
-    return result.returncode, result.stdout, result.stderr
+    # A persistent odiff process would amortize the fork/exec and OCaml runtime startup across
+    # calls, but the odiff CLI is strictly one-shot (no server/REPL mode), so each call has to
+    # spawn a fresh process.
+    # Passing the argv list directly skips shell quoting entirely and on windows avoids spawning
+    # an extra cmd.exe process just to re-parse the command string.
+    result = subprocess.run([_ODIFF_EXE_STR, *args], capture_output=capture_output)
+    if capture_output is False:
+        return result.returncode, "", ""
+    # The pipes are binary so decoding only happens here, when output was actually captured.
+    return (
+        result.returncode,
+        result.stdout.decode("utf-8", "replace"),
+        result.stderr.decode("utf-8", "replace"),
+    )
+
+
+@cache
+def _overlay_colors(color: str, fill: float) -> tuple[np.ndarray, np.ndarray]:
+    """Parse and cache the fill and border RGBA values for an overlay ``color``.
+
+    Parameters
+    ----------
+    color : str
+        Color used for the border and fill of the areas.
+    fill : float
+        Opacity of the area fill (from 0 to 1).
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Fill and border RGBA values.
+    """
+    # numpy costs ~70ms at interpreter startup; imported lazily so plain CLI calls and
+    # comparisons without ignore areas never pay for it.
+    import numpy as np
+    from PIL import ImageColor
+
+    red, green, blue = ImageColor.getrgb(color)[:3]
+    fill_rgba = np.array([red, green, blue, int(255 * fill)], dtype=np.uint8)
+    border_rgba = np.array([red, green, blue, 255], dtype=np.uint8)
+    return fill_rgba, border_rgba
+
+
+def create_ignore_areas_overlay(
+    base_image: Image.Image,
+    ignore_areas: Iterable[IgnoreArea],
+    color: str = "#00B8B8",
+    fill: float = 0.2,
+) -> Image.Image:
+    """Create a transparent overlay image marking ``ignore_areas``.
+
+    The overlay is built as a single NumPy buffer with one slice assignment per rectangle, so the
+    cost is bulk memory writes instead of per-rectangle ``ImageDraw`` calls.
+
+    Parameters
+    ----------
+    base_image : Image.Image
+        Image the overlay is created for (defines the overlay size).
+    ignore_areas : Iterable[IgnoreArea]
+        Areas to mark on the overlay.
+    color : str
+        Color used for the border and fill of the areas. Defaults to "#00B8B8"
+    fill : float
+        Opacity of the area fill (from 0 to 1). Defaults to 0.2
+
+    Returns
+    -------
+    Image.Image
+    """
+    import numpy as np
+
+    fill_rgba, border_rgba = _overlay_colors(color, fill)
+    overlay = np.zeros((base_image.height, base_image.width, 4), dtype=np.uint8)
+    # Walking the areas in forward order with a "first-wins" mask writes every pixel exactly
+    # once, instead of repainting overlap regions per area in reversed order.
+    written = np.zeros((base_image.height, base_image.width), dtype=bool)
+    for x1, y1, x2, y2 in ignore_areas:
+        # The 2px wide border strips go first so the fill of the same area can't cover them.
+        for by1, by2, bx1, bx2 in (
+            (y1, y1 + 2, x1, x2),
+            (max(y1, y2 - 2), y2, x1, x2),
+            (y1, y2, x1, x1 + 2),
+            (y1, y2, max(x1, x2 - 2), x2),
+        ):
+            overlay[by1:by2, bx1:bx2][~written[by1:by2, bx1:bx2]] = border_rgba
+            written[by1:by2, bx1:bx2] = True
+        overlay[y1:y2, x1:x2][~written[y1:y2, x1:x2]] = fill_rgba
+        written[y1:y2, x1:x2] = True
+    return Image.fromarray(overlay, "RGBA")
+
+
+def _alpha_blend_rect(
+    image_arr: np.ndarray, area: IgnoreArea, fill_rgba: np.ndarray, written: np.ndarray
+) -> None:
+    """Blend ``fill_rgba`` into the unwritten pixels of the ``area`` rectangle of ``image_arr``.
+
+    The blend uses the integer approximation ``src + (((dst - src) * (255 - a) + 128) * 257 >>
+    16)`` of the alpha lerp, so it needs no per-pixel division and only touches the rectangle
+    region instead of the whole image. Pixels flagged in ``written`` are left untouched and the
+    whole rectangle is flagged afterwards.
+
+    Parameters
+    ----------
+    image_arr : np.ndarray
+        RGBA image array (``HxWx4`` uint8) to blend into, modified in place.
+    area : IgnoreArea
+        Rectangle region to blend the fill into.
+    fill_rgba : np.ndarray
+        RGBA fill value where the alpha channel is the blend opacity.
+    written : np.ndarray
+        Boolean ``HxW`` mask of pixels already painted, updated in place.
+    """
+    import numpy as np
+
+    x1, y1, x2, y2 = area
+    region = image_arr[y1:y2, x1:x2, :3]
+    todo = ~written[y1:y2, x1:x2]
+    dst = region[todo].astype(np.int32)
+    src = fill_rgba[:3].astype(np.int32)
+    inv_alpha = 255 - int(fill_rgba[3])
+    region[todo] = src + ((((dst - src) * inv_alpha + 128) * 257) >> 16)
+    written[y1:y2, x1:x2] = True
+
+
+def composite_ignore_areas(
+    image: Image.Image,
+    ignore_areas: Iterable[IgnoreArea],
+    color: str = "#00B8B8",
+    fill: float = 0.2,
+) -> Image.Image:
+    """Draw ``ignore_areas`` markings directly onto a copy of ``image``.
+
+    Unlike pasting a full size overlay, only the rectangle regions are blended, so the cost
+    scales with the marked area instead of the image size.
+
+    Parameters
+    ----------
+    image : Image.Image
+        Image to draw the areas onto.
+    ignore_areas : Iterable[IgnoreArea]
+        Areas to mark on the image.
+    color : str
+        Color used for the border and fill of the areas. Defaults to "#00B8B8"
+    fill : float
+        Opacity of the area fill (from 0 to 1). Defaults to 0.2
+
+    Returns
+    -------
+    Image.Image
+    """
+    import numpy as np
+
+    fill_rgba, border_rgba = _overlay_colors(color, fill)
+    image_arr = np.array(image if image.mode == "RGBA" else image.convert("RGBA"))
+    # Forward order with the same "first-wins" mask as ``create_ignore_areas_overlay``, so every
+    # pixel is painted exactly once over the original image and overlapping areas render
+    # identically to compositing the overlay image.
+    written = np.zeros(image_arr.shape[:2], dtype=bool)
+    for area in ignore_areas:
+        x1, y1, x2, y2 = area
+        # The 2px wide border strips go first so the fill of the same area can't cover them.
+        for by1, by2, bx1, bx2 in (
+            (y1, y1 + 2, x1, x2),
+            (max(y1, y2 - 2), y2, x1, x2),
+            (y1, y2, x1, x1 + 2),
+            (y1, y2, max(x1, x2 - 2), x2),
+        ):
+            image_arr[by1:by2, bx1:bx2][~written[by1:by2, bx1:bx2]] = border_rgba
+            written[by1:by2, bx1:bx2] = True
+        _alpha_blend_rect(image_arr, area, fill_rgba, written)
+    return Image.fromarray(image_arr, "RGBA")
 
 
 def load_image(image_path: str | Path) -> Image.Image:
@@ -95,6 +298,26 @@ def load_image(image_path: str | Path) -> Image.Image:
         return im
 
 
+def _frame_pixels(image: Image.Image) -> np.ndarray:
+    """Convert an image to the pixel array fed to ``APNGAsmBinder.add_frame_from_numpy``.
+
+    Parameters
+    ----------
+    image : Image.Image
+        Image to convert.
+
+    Returns
+    -------
+    np.ndarray
+    """
+    import numpy as np
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    # np.array (not np.asarray) because the binding rejects the read-only arrays PIL exposes.
+    return np.array(image)
+
+
 def png_images_to_apng_bytes(
     images: Iterable[Image.Image | None],
     out_file: str | Path | None = None,
@@ -121,17 +344,31 @@ def png_images_to_apng_bytes(
 
     See Also
     --------
-    APNGAsmBinder.add_frame_from_pillow
+    APNGAsmBinder.add_frame_from_numpy
     """
     apngasm = APNGAsmBinder()
 
-    for image in images:
-        if image is not None:
-            apngasm.add_frame_from_pillow(image, delay_num=delay_num, delay_den=delay_den)
-    with TemporaryDirectory() as tmp_dir:
-        out_file = Path(out_file) if out_file is not None else Path(tmp_dir) / "animated.apng"
+    # PIL releases the GIL while decoding/converting pixel data, so the per-frame conversion runs
+    # in parallel and only the (cheap) frame registration stays sequential.
+    with ThreadPoolExecutor() as executor:
+        frames = list(
+            executor.map(_frame_pixels, (image for image in images if image is not None))
+        )
+    for frame in frames:
+        apngasm.add_frame_from_numpy(frame, delay_num=delay_num, delay_den=delay_den)
+    if out_file is not None:
+        out_file = Path(out_file)
         apngasm.assemble(out_file.as_posix())
         return out_file.read_bytes()
+    # ``APNGAsmBinder`` has no in-memory assemble API, so the apng is written to a temp file
+    # placed on a tmpfs backed dir when available and read back.
+    tmp_fd, tmp_name = mkstemp(suffix=".apng", dir=os.environ.get("XDG_RUNTIME_DIR"))
+    os.close(tmp_fd)
+    try:
+        apngasm.assemble(Path(tmp_name).as_posix())
+        return Path(tmp_name).read_bytes()
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
 
 
 @dataclass
@@ -195,19 +432,18 @@ class APNG:
         -------
         Path
         """
-        path = Path(path)
+        path = path if isinstance(path, Path) else Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_bytes(self.data)
         return path
 
     def __str__(self) -> str:  # noqa:DOC
         """Create string repr for instance."""
-        img_str = base64.b64encode(self.data).decode(encoding="utf-8")
-        return (
-            '<img style="border: 1px solid; '
-            f'{CHECKER_TRANSPARENCY_CSS if self.use_checker_transparency is True else ""}" '
-            f'src="data:image/apng;base64,{img_str}">'
-        )
+        # Base64 output is ascii by construction, so the ascii decode (a plain memcpy) skips the
+        # utf-8 validation pass over the whole payload.
+        img_str = base64.b64encode(self.data).decode(encoding="ascii")
+        prefix = _img_prefix(use_checker_transparency=self.use_checker_transparency)
+        return "".join((prefix, img_str, '">'))
 
     def _repr_markdown_(self) -> str:  # noqa:DOC
         """Magic method for rendering automatically in jupyter notebooks."""
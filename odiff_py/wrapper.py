@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from dataclasses import field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import NamedTuple
@@ -11,6 +14,7 @@ from typing import NamedTuple
 from PIL import Image
 
 from odiff_py.utils import APNG
+from odiff_py.utils import composite_ignore_areas
 from odiff_py.utils import load_image
 from odiff_py.utils import run_odiff
 
@@ -23,6 +27,14 @@ class CompareStatus(Enum):
     PIXEL_DIFFERENCE = 22
 
 
+# Computed once at import; avoids a per-call lookup in the non-public Enum internals.
+_VALID_RETURNCODES: frozenset[int] = frozenset(status.value for status in CompareStatus)
+_STATUS_BY_CODE: dict[int, CompareStatus] = {status.value: status for status in CompareStatus}
+_STATUS_TEXT: dict[CompareStatus, str] = {
+    status: status.name.replace("_", " ").capitalize() for status in CompareStatus
+}
+
+
 class IgnoreArea(NamedTuple):
     """Container for odiff ignore are definitions."""
 
@@ -41,18 +53,108 @@ class IgnoreArea(NamedTuple):
         return f"{self.x1}:{self.y1}-{self.x2}:{self.y2}"
 
 
+@lru_cache(maxsize=256)
+def _format_ignore_tuple(areas: tuple[IgnoreArea, ...]) -> str:
+    """Format ``areas`` to the value of the ``--ignore`` CLI argument.
+
+    Cached because the same regions tend to be reused across many comparisons, e.g. in test
+    suites.
+
+    Parameters
+    ----------
+    areas : tuple[IgnoreArea, ...]
+        Areas to format.
+
+    Returns
+    -------
+    str
+    """
+    # printf style formatting is measurably faster than f-strings here.
+    return ",".join("%d:%d-%d:%d" % area for area in areas)  # noqa: UP031
+
+
 @dataclass
 class DiffResult:
     """Result container for odiff comparison."""
 
-    base_image: Image.Image
-    comparing_image: Image.Image
-    diff_image: Image.Image | None
+    _base_image: Image.Image
+    _comparing_image: Image.Image
+    _diff_image: Image.Image | None
     status: CompareStatus
     diff_pixel_count: int | None
     diff_percentage: float | None
     diff_lines: list[int]
     use_checker_transparency: bool = True
+    ignore_areas: list[IgnoreArea] = field(default_factory=list)
+    show_ignore_areas_overlay: bool = True
+
+    def __post_init__(self) -> None:
+        """Initialize the per instance overlay cache."""
+        self._composited_cache: dict[str, Image.Image] = {}
+        self._compose_needed = len(self.ignore_areas) > 0
+
+    def invalidate_overlay_cache(self) -> None:
+        """Clear the cached overlay images, needed after mutating ``ignore_areas`` in place."""
+        self._composited_cache = {}
+        self._compose_needed = len(self.ignore_areas) > 0
+
+    def _composite(self, name: str, image: Image.Image) -> Image.Image:
+        """Get ``image`` with the ignore areas overlay applied, memoized per attribute.
+
+        Parameters
+        ----------
+        name : str
+            Attribute name used as cache key.
+        image : Image.Image
+            Image to composite the overlay onto.
+
+        Returns
+        -------
+        Image.Image
+        """
+        # ``_compose_needed`` is precomputed so the common no-ignore-areas case bails with a
+        # single attribute load; the show flag stays a live lookup since it is user mutable.
+        if self._compose_needed is False or self.show_ignore_areas_overlay is False:
+            return image
+        # The composited images are memoized on the instance, so repeated attribute reads
+        # (repr + apng touch each image several times) only pay for the compositing once.
+        cached = self._composited_cache.get(name)
+        if cached is None:
+            cached = composite_ignore_areas(image, self.ignore_areas)
+            self._composited_cache[name] = cached
+        return cached
+
+    @property
+    def base_image(self) -> Image.Image:
+        """Base image, with the ignore areas overlay applied when active.
+
+        Returns
+        -------
+        Image.Image
+        """
+        return self._composite("base_image", self._base_image)
+
+    @property
+    def comparing_image(self) -> Image.Image:
+        """Comparing image, with the ignore areas overlay applied when active.
+
+        Returns
+        -------
+        Image.Image
+        """
+        return self._composite("comparing_image", self._comparing_image)
+
+    @property
+    def diff_image(self) -> Image.Image | None:
+        """Diff image if there was any, with the ignore areas overlay applied when active.
+
+        Returns
+        -------
+        Image.Image | None
+        """
+        if self._diff_image is None:
+            return None
+        return self._composite("diff_image", self._diff_image)
 
     def create_apng(
         self,
@@ -73,6 +175,8 @@ class DiffResult:
         -------
         APNG
         """
+        # The attribute reads return the memoized overlay composites, so assembling the apng does
+        # not trigger another compositing pass per frame.
         images = [self.base_image, self.comparing_image, self.diff_image]
         return APNG.from_images(images, delay_num=delay_num, delay_den=delay_den)
 
@@ -83,9 +187,9 @@ class DiffResult:
         result_lines = [
             "|Meaning|Value|",
             "|-------|-----|",
-            f"|Status|{self.status.name.replace('_',' ').capitalize()}|",
+            f"|Status|{_STATUS_TEXT[self.status]}|",
             f"|Diff Pixel Count|{self.diff_pixel_count}|",
-            f"|Diff Percentage|{self.diff_percentage:.2f}%|",
+            "|Diff Percentage|%.2f%%|" % self.diff_percentage,  # noqa: UP031
         ]
         if len(self.diff_lines) > 0:
             result_lines.append(f"|Diff Lines|{self.diff_lines}|")
@@ -106,6 +210,7 @@ def _odiff(  # noqa: C901
     ignore: list[IgnoreArea | tuple[int, int, int, int]] | None = None,
     output_diff_lines: bool = False,
     reduce_ram_usage: bool = False,
+    show_ignore_areas_overlay: bool = True,
     threshold: float = 0.1,
 ) -> DiffResult:
     """Run odiff in a temp directory.
@@ -138,6 +243,9 @@ def _odiff(  # noqa: C901
     reduce_ram_usage : bool
         With this flag enabled odiff will use less memory, but will be slower in some cases.
         Defaults to False
+    show_ignore_areas_overlay : bool
+        Whether or not to show the ignored areas as overlay on the result images.
+        Defaults to True
     threshold : float
         Color difference threshold (from 0 to 1). Less more precise. Defaults to 0.1
 
@@ -151,16 +259,32 @@ def _odiff(  # noqa: C901
         If odiff throws an unexpected error.
     """
     cli_args = ["--parsable-stdout"]
+    # Already constructed IgnoreArea instances are reused as is instead of being rebuilt.
+    ignore_areas = (
+        [ia if type(ia) is IgnoreArea else IgnoreArea(*ia) for ia in ignore]
+        if ignore is not None
+        else []
+    )
+    # User supplied image objects are kept so the result doesn't re-decode them from disk.
+    base_img = base if isinstance(base, Image.Image) else None
+    comparing_img = comparing if isinstance(comparing, Image.Image) else None
+    # The tmp PNGs only exist for the odiff run and die with the tempdir, so encode time matters
+    # and compression ratio doesn't.
     if isinstance(base, Image.Image):
         base_path = tmp_dir / "base.png"
-        base.save(base_path)
+        base.save(base_path, format="PNG", optimize=False, compress_level=1)
         base = base_path
     if isinstance(comparing, Image.Image):
         comparing_path = tmp_dir / "comparing.png"
-        comparing.save(comparing_path)
+        comparing.save(comparing_path, format="PNG", optimize=False, compress_level=1)
         comparing = comparing_path
+    # Normalized to Path once, so the CLI args and the loads below don't rebuild Path objects.
+    base = base if isinstance(base, Path) else Path(base)
+    comparing = comparing if isinstance(comparing, Path) else Path(comparing)
     if diff is None:
         diff = tmp_dir / "diff.png"
+    elif isinstance(diff, Path) is False:
+        diff = Path(diff)
     if antialiasing is True:
         cli_args.append("--antialiasing")
     cli_args.append(f"--diff-color={diff_color}")
@@ -169,7 +293,7 @@ def _odiff(  # noqa: C901
     if fail_on_layout is True:
         cli_args.append("--fail-on-layout")
     if ignore is not None:
-        cli_args.append(f"--ignore={','.join(IgnoreArea(*ia).to_region_str() for ia in ignore)}")
+        cli_args.append(f"--ignore={_format_ignore_tuple(tuple(ignore_areas))}")
     if output_diff_lines is True:
         cli_args.append("--output-diff-lines")
     if reduce_ram_usage is True:
@@ -177,27 +301,49 @@ def _odiff(  # noqa: C901
     cli_args.append(f"--threshold={threshold}")
     cli_args.extend(
         [
-            Path(base).as_posix(),
-            Path(comparing).as_posix(),
-            Path(diff).as_posix(),
+            base.as_posix(),
+            comparing.as_posix(),
+            diff.as_posix(),
         ]
     )
 
     returncode, stdout, stderr = run_odiff(*cli_args)
-    if returncode not in CompareStatus._value2member_map_:
+    if returncode not in _VALID_RETURNCODES:
         msg = f"Error calling odiff executable:\n{stderr}"
         raise RuntimeError(msg)
     diff_pixel_count, _, rest = stdout.partition(";")
     diff_percent, _, diff_lines = rest.partition(";")
+    # With --output-diff-lines odiff can emit thousands of line numbers; parsing them with the
+    # C level tokenizer in np.fromstring avoids a per-number Python int() loop. The truthiness +
+    # isspace check detects the (common) empty case without allocating a stripped copy.
+    if diff_lines and diff_lines.isspace() is False:
+        import numpy as np
+
+        # "\r" matters since the binary pipes skip universal-newline translation on windows.
+        parsed_diff_lines = np.fromstring(
+            diff_lines.strip(" \r\n,"), dtype=np.int64, sep=","
+        ).tolist()
+    else:
+        parsed_diff_lines = []
+
+    # PNG decoding releases the GIL, so the remaining image loads run concurrently.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        base_future = executor.submit(load_image, base) if base_img is None else None
+        comparing_future = (
+            executor.submit(load_image, comparing) if comparing_img is None else None
+        )
+        diff_future = executor.submit(load_image, diff) if diff.is_file() else None
 
     return DiffResult(
-        base_image=load_image(base),
-        comparing_image=load_image(comparing),
-        diff_image=load_image(diff) if Path(diff).is_file() else None,
-        status=CompareStatus(returncode),
+        _base_image=base_img if base_img is not None else base_future.result(),
+        _comparing_image=comparing_img if comparing_img is not None else comparing_future.result(),
+        _diff_image=diff_future.result() if diff_future is not None else None,
+        status=_STATUS_BY_CODE[returncode],
         diff_pixel_count=int(diff_pixel_count) if diff_pixel_count != "" else None,
         diff_percentage=float(diff_percent) if diff_percent != "" else None,
-        diff_lines=[int(line_nr) for line_nr in diff_lines.split(",") if line_nr.rstrip() != ""],
+        diff_lines=parsed_diff_lines,
+        ignore_areas=ignore_areas,
+        show_ignore_areas_overlay=show_ignore_areas_overlay,
     )
 
 
@@ -213,6 +359,7 @@ def odiff(
     ignore: list[IgnoreArea | tuple[int, int, int, int]] | None = None,
     output_diff_lines: bool = False,
     reduce_ram_usage: bool = False,
+    show_ignore_areas_overlay: bool = True,
     threshold: float = 0.1,
 ) -> DiffResult:
     """Run odiff in a temp directory.
@@ -243,6 +390,9 @@ def odiff(
     reduce_ram_usage : bool
         With this flag enabled odiff will use less memory, but will be slower in some cases.
         Defaults to False
+    show_ignore_areas_overlay : bool
+        Whether or not to show the ignored areas as overlay on the result images.
+        Defaults to True
     threshold : float
         Color difference threshold (from 0 to 1). Less more precise. Defaults to 0.1
 
@@ -255,7 +405,10 @@ def odiff(
     RuntimeError
         If odiff throws an unexpected error.
     """
-    with TemporaryDirectory(prefix="odiff-py-") as tmp_dir_str:
+    # The odiff CLI only works on files; on Linux /dev/shm is memory backed, which at least
+    # spares the tmp PNGs and the diff image the round-trip over the disk.
+    tmp_dir_root = "/dev/shm" if Path("/dev/shm").is_dir() else None
+    with TemporaryDirectory(prefix="odiff-py-", dir=tmp_dir_root) as tmp_dir_str:
         tmp_dir = Path(tmp_dir_str)
         return _odiff(
             tmp_dir=tmp_dir,
@@ -269,5 +422,6 @@ def odiff(
             ignore=ignore,
             output_diff_lines=output_diff_lines,
             reduce_ram_usage=reduce_ram_usage,
+            show_ignore_areas_overlay=show_ignore_areas_overlay,
             threshold=threshold,
         )
@@ -0,0 +1,50 @@
+"""Shared fixtures for the odiff-py test suite."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from tests import TEST_DATA
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _decoded(path: Path) -> np.ndarray:
+    """Decode the image at ``path`` to a pixel array."""
+    with Image.open(path) as img:
+        return np.asarray(img)
+
+
+@pytest.fixture(scope="session")
+def tiger1_arr() -> np.ndarray:
+    """Pixel array of `tiger-1.jpg`, decoded once per session."""
+    return _decoded(TEST_DATA / "tiger-1.jpg")
+
+
+@pytest.fixture(scope="session")
+def tiger2_arr() -> np.ndarray:
+    """Pixel array of `tiger-2.jpg`, decoded once per session."""
+    return _decoded(TEST_DATA / "tiger-2.jpg")
+
+
+@pytest.fixture(scope="session")
+def expected_diff_arr() -> np.ndarray:
+    """Pixel array of `tiger-diff.png`, decoded once per session."""
+    return _decoded(TEST_DATA / "tiger-diff.png")
+
+
+@pytest.fixture(scope="session")
+def expected_diff_mask_arr() -> np.ndarray:
+    """Pixel array of `tiger-diff-mask.png`, decoded once per session."""
+    return _decoded(TEST_DATA / "tiger-diff-mask.png")
+
+
+@pytest.fixture(scope="session")
+def expected_diff_md() -> str:
+    """Content of `diff-result.md`, read once per session."""
+    return (TEST_DATA / "diff-result.md").read_text()
@@ -73,9 +73,9 @@ def test_apng_save(tmp_path: Path):
     assert test_file.read_bytes() == expected_file.read_bytes()
 
 
-def test_apng_repr():
+def test_apng_repr(expected_diff_md: str):
     """Test both the string and jupter repr."""
-    _, _, expected = (TEST_DATA / "diff-result.md").read_text().partition("<br>")
+    _, _, expected = expected_diff_md.partition("<br>")
     diff_apng = APNG.from_file(TEST_DATA / "tiger-compare.apng")
     assert f"{diff_apng}" == expected.rstrip()
     assert diff_apng._repr_markdown_() == expected.rstrip()
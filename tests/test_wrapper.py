@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import TypedDict
 from typing import cast
@@ -11,6 +13,7 @@ import pytest
 from PIL import Image
 
 from odiff_py.utils import APNG
+from odiff_py.utils import create_ignore_areas_overlay
 from odiff_py.wrapper import CompareStatus
 from odiff_py.wrapper import DiffResult
 from odiff_py.wrapper import IgnoreArea
@@ -34,93 +37,181 @@ def default_test_args():
     return {"base": TEST_DATA / "tiger-1.jpg", "comparing": TEST_DATA / "tiger-2.jpg"}
 
 
-def same_image_array(result: Image.Image, expected: Image.Image) -> bool:
-    """Check for equality using numpy all close, to be independent of format."""
-    return np.allclose(np.asarray(result), np.asarray(expected))
+@pytest.fixture(scope="session")
+def expected_apng() -> APNG:
+    """APNG built from `tiger-compare.apng`, loaded once per session."""
+    return APNG.from_file(TEST_DATA / "tiger-compare.apng")
 
 
-def check_default_result(result: DiffResult):
+@lru_cache(maxsize=None)
+def _pil_cached(path: Path) -> Image.Image:
+    """Load the image at ``path`` once and reuse it across tests."""
+    with Image.open(path) as img:
+        img.load()
+        return img
+
+
+def same_image_array(result: Image.Image, expected: Image.Image | np.ndarray) -> bool:
+    """Check for pixel equality on the raw uint8 arrays, to be independent of format."""
+    if result is expected:
+        return True
+    if isinstance(expected, Image.Image) and (
+        result.size != expected.size or result.mode != expected.mode
+    ):
+        return False
+    result_arr = np.asarray(result)
+    expected_arr = np.asarray(expected)
+    return result_arr.shape == expected_arr.shape and np.array_equal(result_arr, expected_arr)
+
+
+def check_default_result(result: DiffResult, tiger1_arr: np.ndarray, tiger2_arr: np.ndarray):
     """Check default result when comparing `tiger-1.jpg` and `tiger-2.jpg`."""
-    assert same_image_array(result.base_image, Image.open(TEST_DATA / "tiger-1.jpg"))
-    assert same_image_array(result.comparing_image, Image.open(TEST_DATA / "tiger-2.jpg"))
+    assert same_image_array(result.base_image, tiger1_arr)
+    assert same_image_array(result.comparing_image, tiger2_arr)
     assert result.status == CompareStatus.PIXEL_DIFFERENCE
     assert result.diff_pixel_count == 7789
     assert result.diff_percentage == pytest.approx(1.167766)
 
 
-def test_default(default_test_args: DefaultTestArgs):
+def test_default(
+    default_test_args: DefaultTestArgs,
+    tiger1_arr: np.ndarray,
+    tiger2_arr: np.ndarray,
+    expected_diff_arr: np.ndarray,
+):
     """Using only defaults gives the same result as calling the odiff CLI without extra options."""
     result = odiff(**default_test_args)
-    check_default_result(result)
+    check_default_result(result, tiger1_arr, tiger2_arr)
     assert result.diff_lines == []
     assert result.diff_image is not None
-    assert same_image_array(result.diff_image, Image.open(TEST_DATA / "tiger-diff.png"))
+    assert same_image_array(result.diff_image, expected_diff_arr)
 
 
-def test_image_object_input(default_test_args: DefaultTestArgs):
+def test_image_object_input(
+    default_test_args: DefaultTestArgs,
+    tiger1_arr: np.ndarray,
+    tiger2_arr: np.ndarray,
+    expected_diff_arr: np.ndarray,
+):
     """Using ``PIL.Image.Image`` for base and comparing image works."""
     result = odiff(
-        base=Image.open(default_test_args["base"]),
-        comparing=Image.open(default_test_args["comparing"]),
+        base=_pil_cached(default_test_args["base"]),
+        comparing=_pil_cached(default_test_args["comparing"]),
     )
-    check_default_result(result)
+    check_default_result(result, tiger1_arr, tiger2_arr)
     assert result.diff_lines == []
     assert result.diff_image is not None
-    assert same_image_array(result.diff_image, Image.open(TEST_DATA / "tiger-diff.png"))
+    assert same_image_array(result.diff_image, expected_diff_arr)
 
 
-def test_write_diff_image_to_disk(default_test_args: DefaultTestArgs, tmp_path: Path):
+def test_write_diff_image_to_disk(
+    default_test_args: DefaultTestArgs,
+    tmp_path: Path,
+    tiger1_arr: np.ndarray,
+    tiger2_arr: np.ndarray,
+    expected_diff_arr: np.ndarray,
+):
     """When using a path or str, the diff image is created on disk."""
     diff_path = tmp_path / "diff.png"
     result = odiff(diff=diff_path, **default_test_args)
-    check_default_result(result)
+    check_default_result(result, tiger1_arr, tiger2_arr)
     assert result.diff_lines == []
     assert result.diff_image is not None
-    assert same_image_array(result.diff_image, Image.open(TEST_DATA / "tiger-diff.png"))
+    assert same_image_array(result.diff_image, expected_diff_arr)
     assert diff_path.is_file() is True
-    assert same_image_array(Image.open(diff_path), Image.open(TEST_DATA / "tiger-diff.png"))
-
-
-def test_output_diff_lines(default_test_args: DefaultTestArgs):
+    written_digest = hashlib.blake2b(diff_path.read_bytes()).digest()
+    expected_digest = hashlib.blake2b((TEST_DATA / "tiger-diff.png").read_bytes()).digest()
+    if written_digest != expected_digest:
+        # The encoder may change while the pixels still match; only then pay for the decode.
+        assert same_image_array(Image.open(diff_path), expected_diff_arr)
+
+
+def test_output_diff_lines(
+    default_test_args: DefaultTestArgs,
+    tiger1_arr: np.ndarray,
+    tiger2_arr: np.ndarray,
+    expected_diff_arr: np.ndarray,
+):
     """When using a path or str, the diff image is created on disk."""
     result = odiff(output_diff_lines=True, **default_test_args)
-    check_default_result(result)
+    check_default_result(result, tiger1_arr, tiger2_arr)
     assert result.diff_lines == list(range(13, 187))
     assert result.diff_image is not None
-    assert same_image_array(result.diff_image, Image.open(TEST_DATA / "tiger-diff.png"))
+    assert same_image_array(result.diff_image, expected_diff_arr)
 
 
-@pytest.mark.parametrize(
-    "ignore",
-    [
-        [(0, 0, 1000, 200)],
-        [IgnoreArea(0, 0, 1000, 200)],
-        [(0, 0, 1000, 100), IgnoreArea(0, 100, 1000, 200)],
-    ],
+# Plain coordinate tuples so collection doesn't construct IgnoreArea instances; with xdist
+# every worker re-imports the module and would pay that again.
+_IGNORE_CASES = (
+    ((0, 0, 1000, 200),),
+    ((0, 0, 1000, 100), (0, 100, 1000, 200)),
 )
+
+
+@pytest.mark.parametrize("use_ignore_area_cls", [True, False])
+@pytest.mark.parametrize("raw_ignore", _IGNORE_CASES)
 def test_ignore_diff_area(
-    default_test_args: DefaultTestArgs, ignore: list[IgnoreArea | tuple[int, int, int, int]]
+    default_test_args: DefaultTestArgs,
+    raw_ignore: tuple[tuple[int, int, int, int], ...],
+    use_ignore_area_cls: bool,  # noqa: FBT001
 ):
     """Image match if the diff area is covered with ignores."""
+    ignore: list[IgnoreArea | tuple[int, int, int, int]] = (
+        [IgnoreArea(*area) for area in raw_ignore] if use_ignore_area_cls else list(raw_ignore)
+    )
     result = odiff(ignore=ignore, **default_test_args)
     assert result.status == CompareStatus.IMAGE_MATCH
     assert result.diff_lines == []
     assert result.diff_image is None
 
 
-def test_diff_mask(default_test_args: DefaultTestArgs):
+@pytest.mark.parametrize(
+    "ignore",
+    [
+        [(0, 0, 1000, 100), IgnoreArea(0, 100, 1000, 200)],
+        # Overlapping areas exercise the "first-wins" overlap handling of the compositing.
+        [(0, 0, 1000, 150), IgnoreArea(0, 50, 600, 200), (400, 100, 1000, 200)],
+    ],
+)
+def test_ignore_areas_on_result_images(
+    default_test_args: DefaultTestArgs, ignore: list[IgnoreArea | tuple[int, int, int, int]]
+):
+    """Ignore areas are drawn on the result images when ``show_ignore_areas_overlay`` is used."""
+    result = odiff(ignore=ignore, **default_test_args)
+    assert result.status == CompareStatus.IMAGE_MATCH
+    for image_name in ("base_image", "comparing_image"):
+        raw_image = getattr(result, f"_{image_name}")
+        overlay = create_ignore_areas_overlay(raw_image, result.ignore_areas)
+        # alpha_composite clones and blends in one pass instead of copy() plus paste().
+        expected = Image.alpha_composite(raw_image.convert("RGBA"), overlay)
+        # Plain array equality suffices for in-memory images and skips the odiff subprocess
+        # round-trip (PNG encode + spawn + decode) per assertion.
+        assert same_image_array(getattr(result, image_name), expected)
+        result.show_ignore_areas_overlay = False
+        assert same_image_array(getattr(result, image_name), raw_image)
+        result.show_ignore_areas_overlay = True
+
+
+def test_diff_mask(
+    default_test_args: DefaultTestArgs,
+    tiger1_arr: np.ndarray,
+    tiger2_arr: np.ndarray,
+    expected_diff_mask_arr: np.ndarray,
+):
     """Using the diff mask option generate the diff mask image."""
     result = odiff(diff_mask=True, **default_test_args)
-    check_default_result(result)
+    check_default_result(result, tiger1_arr, tiger2_arr)
     assert result.diff_lines == []
     assert result.diff_image is not None
-    assert same_image_array(result.diff_image, Image.open(TEST_DATA / "tiger-diff-mask.png"))
+    assert same_image_array(result.diff_image, expected_diff_mask_arr)
 
 
-def test_reduce_ram_usage(default_test_args: DefaultTestArgs):
+def test_reduce_ram_usage(
+    default_test_args: DefaultTestArgs, tiger1_arr: np.ndarray, tiger2_arr: np.ndarray
+):
     """We can only test that the results are correct and the call doesn't cause a crash."""
     result = odiff(reduce_ram_usage=True, **default_test_args)
-    check_default_result(result)
+    check_default_result(result, tiger1_arr, tiger2_arr)
 
 
 def test_fail_on_layout():
@@ -147,22 +238,22 @@ def test_odiff_cli_error(monkeypatch: pytest.MonkeyPatch, default_test_args: Def
     assert str(exec_info.value) == "Error calling odiff executable:\nRandom CLI Error"
 
 
-def test_diff_result_create_apng(default_test_args: DefaultTestArgs):
+def test_diff_result_create_apng(default_test_args: DefaultTestArgs, expected_apng: APNG):
     """Create expected ``apng`` file content."""
     result = odiff(diff_mask=True, **default_test_args)
-    expected = TEST_DATA / "tiger-compare.apng"
-    assert result.create_apng() == APNG.from_file(expected)
+    assert result.create_apng() == expected_apng
 
 
 def test_result_md_repr_no_diff(default_test_args: DefaultTestArgs):
     """MD repr is as expected."""
-    test_args = cast(DefaultTestArgs, default_test_args | {"comparing": TEST_DATA / "tiger-1.jpg"})
+    test_args = cast(
+        "DefaultTestArgs", default_test_args | {"comparing": TEST_DATA / "tiger-1.jpg"}
+    )
     result = odiff(**test_args)
     assert result._repr_markdown_() == "Images are identical."
 
 
-def test_result_md_repr_on_diff(default_test_args: DefaultTestArgs):
+def test_result_md_repr_on_diff(default_test_args: DefaultTestArgs, expected_diff_md: str):
     """MD repr for diff is as expected."""
     result = odiff(diff_mask=True, output_diff_lines=True, **default_test_args)
-    expected = (TEST_DATA / "diff-result.md").read_text()
-    assert result._repr_markdown_() == expected
+    assert result._repr_markdown_() == expected_diff_md